@@ -9,70 +9,32 @@ Use CLI arguments to specify symbol(s), currency, and profit/loss percentages.
 See README for details.
 """
 
-import os
 import argparse
 import logging
-import requests
-from typing import List, Dict, Tuple
+import threading
 
 import config  # custom config file with default values
 
+# Names re-exported from core; resolved on first access by __getattr__ below.
+_CORE_EXPORTS = ("analyze_with_model", "calculate_trade_levels", "fetch_market_data", "fetch_news")
 
-def fetch_market_data(symbols: List[str], currency: str) -> Dict[str, Dict[str, float]]:
-    """Fetch cryptocurrency market data from CoinGecko API for given symbols and currency."""
-    url = "https://api.coingecko.com/api/v3/simple/price"
-    params = {"ids": ",".join(symbols), "vs_currencies": currency}
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logging.error("Failed to fetch market data: %s", e)
-        return {}
 
+def __getattr__(name: str):
+    """Lazily re-export the shared core helpers so importing this script stays cheap."""
+    if name in _CORE_EXPORTS:
+        import core
 
-def fetch_news(limit: int = 5) -> List[str]:
-    """Fetch latest news headlines from CryptoNews API if API key provided."""
-    api_key = os.getenv("NEWS_API_KEY")
-    if not api_key:
-        return []
-    url = "https://cryptonews-api.com/api/v1/category"
-    params = {"section": "general", "items": limit, "apikey": api_key}
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        return [article.get("title", "") for article in data.get("data", [])]
-    except requests.exceptions.RequestException as e:
-        logging.error("Failed to fetch news: %s", e)
-        return []
-
-
-def analyze_with_model(market_data: Dict[str, Dict[str, float]], news: List[str]) -> str:
-    """Send combined market data and news to external AI model and return action (buy/hold/sell)."""
-    model_url = os.getenv("MODEL_API_URL")
-    model_key = os.getenv("MODEL_API_KEY")
-    if not model_url or not model_key:
-        return "hold"
-    payload = {"market_data": market_data, "news": news}
-    headers = {"Authorization": f"Bearer {model_key}", "Content-Type": "application/json"}
-    try:
-        response = requests.post(model_url, json=payload, headers=headers, timeout=10)
-        response.raise_for_status()
-        result = response.json()
-        return result.get("action", "hold")
-    except requests.exceptions.RequestException as e:
-        logging.error("Failed to call model API: %s", e)
-        return "hold"
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def calculate_trade_levels(price: float, action: str, tp_pct: float, sl_pct: float) -> Tuple[float, float]:
-    """Calculate take-profit and stop-loss levels based on current price and action."""
-    if action == "buy":
-        return price * (1 + tp_pct), price * (1 - sl_pct)
-    elif action == "sell":
-        return price * (1 - tp_pct), price * (1 + sl_pct)
-    return price, price
+def notify_telegram(message: str) -> None:
+    """Send a trade notification via Telegram, logging instead of raising on failure."""
+    try:
+        from telegram_utils import send_telegram_message
+        send_telegram_message(message)
+    except Exception as e:
+        logging.error("Failed to send Telegram notification: %s", e)
 
 
 def parse_args() -> argparse.Namespace:
@@ -108,41 +70,51 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     """Main execution function for the trading bot."""
     args = parse_args()
+
+    # Heavy dependencies (numpy, numba, httpx) are imported only after the arguments are parsed,
+    # so --help and invalid invocations exit without loading them.
+    import numpy as np
+
+    from analysis_utils import calculate_trade_levels_batch
+    from core import analyze_with_model, fetch_market_data, fetch_news
+
     symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
     # Configure logging to provide timestamped info
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
-    logging.info("Fetching market data for symbols %s in %s", symbols, args.currency)
-    market_data = fetch_market_data(symbols, args.currency)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    currency = args.currency
+    logging.info("Fetching market data for symbols %s in %s", symbols, currency)
+    try:
+        market_data = fetch_market_data(symbols, currency)
+    except Exception as e:
+        logging.error("Failed to fetch market data: %s", e)
+        return
     logging.info("Market data: %s", market_data)
     news = fetch_news()
     if news:
         logging.info("Latest news headlines: %s", news)
-    action = analyze_with_model(market_data, news)
+    # The model receives the nested {symbol: {currency: price}} shape CoinGecko returns
+    action = analyze_with_model({s: {currency: p} for s, p in market_data.items()}, news)
     logging.info("AI model action: %s", action)
-    for symbol in symbols:
-        price = market_data[symbol][args.currency]
-        take_profit, stop_loss = calculate_trade_levels(price, action, args.tp, args.sl)
-        logging.info(
-            "For %s at price %f: take-profit %f, stop-loss %f",
-            symbol,
-            price,
-            take_profit,
-            stop_loss,
-        )
+    prices = np.fromiter((market_data[s] for s in symbols), dtype=np.float64, count=len(symbols))
+    tp_arr, sl_arr = calculate_trade_levels_batch(prices, action, args.tp, args.sl)
+    for symbol, price, tp, sl in zip(symbols, prices, tp_arr, sl_arr):
+        logging.info("For %s at price %f: take-profit %f, stop-loss %f", symbol, price, tp, sl)
+    # Send trade notification via Telegram in the background so the result is printed immediately.
+    # The thread is non-daemon, so the process still waits for the message to go out before exiting.
+    body = "\n".join(
+        f"{s.upper()} {p:.2f} {currency}, TP {tp:.2f}, SL {sl:.2f}" for s, p, tp, sl in zip(symbols, prices, tp_arr, sl_arr)
+    )
+    message = f"Trading signal: {action.upper()}\n{body}"
+    notifier = threading.Thread(target=notify_telegram, args=(message,), daemon=False)
+    notifier.start()
     # Print final action for user reference
     print("Action:", action)
-    # Send trade notification via Telegram
-    message_lines = [f"Trading signal: {action.upper()}"]
-    for symbol in symbols:
-        price = market_data[symbol][args.currency]
-        tp, sl = calculate_trade_levels(price, action, args.tp, args.sl)
-        message_lines.append(f"{symbol.upper()} {price:.2f} {args.currency}, TP {tp:.2f}, SL {sl:.2f}")
-    message = "\n".join(message_lines)
-    try:
-        from telegram_utils import send_telegram_message
-        send_telegram_message(message)
-    except Exception as e:
-        logging.error("Failed to send Telegram notification: %s", e)
+    notifier.join(timeout=2.0)
 
 
 if __name__ == "__main__":
@@ -1,44 +1,151 @@
 """
 Utility functions for market data analysis.
 
-This module provides functions to calculate moving averages and
-relative strength index (RSI) for a sequence of price data.
+This module provides functions to calculate moving averages,
+relative strength index (RSI) and take-profit/stop-loss levels for price data.
+The numeric kernels are compiled with Numba when it is installed; without it the
+RSI uses a vectorized NumPy path and the remaining kernels run as plain Python.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
 
-def calculate_moving_average(prices: List[float], window: int = 7) -> Optional[float]:
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; fall back to the interpreted kernels
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit supporting both bare and parameterised use."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Price series may be passed as plain lists or as float64 arrays (as returned by the data fetchers).
+PriceSeries = Union[List[float], np.ndarray]
+
+
+@njit(cache=True, nogil=True)
+def _sma_core(prices: np.ndarray, window: int) -> float:
+    """Average the last `window` values of a float64 array (or all of them if fewer)."""
+    n = len(prices)
+    lo = max(0, n - window)
+    total = 0.0
+    for i in range(lo, n):
+        total += prices[i]
+    return total / (n - lo)
+
+
+def calculate_moving_average(prices: PriceSeries, window: int = 7) -> Optional[float]:
     """
     Calculate the simple moving average for the last `window` prices.
     If fewer than `window` prices are provided, returns the average of all prices.
     """
-    if not prices:
+    if len(prices) == 0:
         return None
-    if len(prices) < window:
-        return sum(prices) / len(prices)
-    return sum(prices[-window:]) / window
+    return float(_sma_core(np.asarray(prices, dtype=np.float64), window))
 
 
-def calculate_rsi(prices: List[float], period: int = 14) -> Optional[float]:
+def mean_of_histories(histories: List[Optional[np.ndarray]]) -> np.ndarray:
     """
-    Calculate the Relative Strength Index (RSI) for a list of prices.
-    Returns None if not enough data is available.
+    Return the mean of each whole price history as a float64 array (not a `window`-limited average).
+    Histories may differ in length; missing (None) or empty ones yield NaN.
     """
-    if len(prices) < period + 1:
-        return None
+    return np.array([h.mean() if h is not None and h.size else np.nan for h in histories], dtype=np.float64)
+
 
+def rolling_sma(prices: PriceSeries, window: int) -> np.ndarray:
+    """
+    Calculate the simple moving average of every full `window` of prices.
+    Returns an array of len(prices) - window + 1 values, or an empty array if there is not enough data.
+    """
+    arr = np.asarray(prices, dtype=np.float64)
+    if window <= 0 or len(arr) < window:
+        return np.empty(0, dtype=np.float64)
+    cumsum = np.concatenate(([0.0], np.cumsum(arr)))
+    return (cumsum[window:] - cumsum[:-window]) / window
+
+
+@njit(cache=True, fastmath=True, nogil=True, boundscheck=False)
+def _rsi_core(prices: np.ndarray, period: int) -> float:
+    """Compute the RSI over the last `period` changes of a contiguous float64 array."""
+    n = len(prices)
     gains = 0.0
     losses = 0.0
-    for i in range(-period, 0):
+    for i in range(n - period, n):
+        # Branchless accumulation keeps the loop body straight-line so LLVM can vectorize it
         change = prices[i] - prices[i - 1]
-        if change > 0:
-            gains += change
-        else:
-            losses -= change  # change is negative
+        gains += max(change, 0.0)
+        losses += max(-change, 0.0)
+    return _rsi_from_sums(gains, losses, period)
 
+
+@njit(cache=True)
+def _rsi_from_sums(gains: float, losses: float, period: int) -> float:
+    """Turn summed gains and losses over `period` changes into an RSI value."""
     average_gain = gains / period
     average_loss = losses / period if losses != 0 else 0.001  # avoid division by zero
     rs = average_gain / average_loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    return 100 - (100 / (1 + rs))
+
+
+def _rsi_numpy(prices: np.ndarray, period: int) -> float:
+    """Vectorized NumPy equivalent of _rsi_core, used when Numba is not installed."""
+    changes = np.diff(prices[-(period + 1):])
+    gains = float(np.maximum(changes, 0.0).sum())
+    losses = float(np.maximum(-changes, 0.0).sum())
+    return _rsi_from_sums(gains, losses, period)
+
+
+def calculate_rsi(prices: PriceSeries, period: int = 14) -> Optional[float]:
+    """
+    Calculate the Relative Strength Index (RSI) for a list or array of prices.
+    Returns None if not enough data is available.
+    """
+    if len(prices) < period + 1:
+        return None
+    arr = np.ascontiguousarray(prices, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return float(_rsi_core(arr, period))
+    return _rsi_numpy(arr, period)
+
+
+def trade_level_multipliers(action: str, tp_pct: float, sl_pct: float) -> Tuple[float, float]:
+    """
+    Return the (take_profit, stop_loss) price multipliers for a trade action.
+    Hold (or any unknown action) keeps both levels at the current price.
+    """
+    if action == "buy":
+        return 1 + tp_pct, 1 - sl_pct
+    if action == "sell":
+        return 1 - tp_pct, 1 + sl_pct
+    return 1.0, 1.0
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _trade_levels_vec(
+    prices: np.ndarray, tp_mul: float, sl_mul: float, tp_out: np.ndarray, sl_out: np.ndarray
+) -> None:
+    """Write take-profit and stop-loss levels for every price into the preallocated output arrays."""
+    for i in range(len(prices)):
+        tp_out[i] = prices[i] * tp_mul
+        sl_out[i] = prices[i] * sl_mul
+
+
+def calculate_trade_levels_batch(
+    prices: np.ndarray, action: str, tp_pct: float, sl_pct: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate take-profit and stop-loss levels for an array of prices sharing one action.
+    Returns two float64 arrays (take_profit, stop_loss) aligned with `prices`.
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    tp_mul, sl_mul = trade_level_multipliers(action, tp_pct, sl_pct)
+    tp_out = np.empty_like(prices)
+    sl_out = np.empty_like(prices)
+    _trade_levels_vec(prices, tp_mul, sl_mul, tp_out, sl_out)
+    return tp_out, sl_out
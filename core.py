@@ -0,0 +1,164 @@
+"""
+Core data fetching and signal functions shared by the trading bot entry points.
+
+Both ai_trading_bot.py and ai_trading_bot_enhanced.py import market data, price history, news,
+model analysis and trade level helpers from here instead of keeping their own copies.
+"""
+
+import asyncio
+import hashlib
+import os
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import httpx
+
+from analysis_utils import trade_level_multipliers
+from http_utils import CLIENT, conditional_get_json, json_dumps, json_loads, ttl_cache
+
+
+def fetch_market_data(symbols: List[str], currency: str) -> Dict[str, float]:
+    """
+    Fetch current cryptocurrency prices from CoinGecko for given symbols.
+    Returns a mapping of symbol to price (0.0 for symbols CoinGecko does not know).
+    Raises httpx.HTTPError if the request fails.
+    """
+    url = "https://api.coingecko.com/api/v3/simple/price"
+    params = {"ids": ",".join(symbols), "vs_currencies": currency}
+    data = conditional_get_json(url, params=params)
+    return {sym: float(data.get(sym, {}).get(currency, 0.0)) for sym in symbols}
+
+
+def fetch_all_historical(symbols: List[str], currency: str) -> Dict[str, np.ndarray]:
+    """
+    Fetch the last 7 days of hourly prices for all symbols with a single CoinGecko /coins/markets call.
+    Returns a mapping of symbol to a float64 price array; symbols without data are left out, and a failed
+    request or unexpected response yields an empty mapping.
+    """
+    histories = _fetch_all_historical_cached(tuple(symbols), currency)
+    return histories if histories is not None else {}
+
+
+@ttl_cache(300)
+def _fetch_all_historical_cached(symbols: Tuple[str, ...], currency: str) -> Optional[Dict[str, np.ndarray]]:
+    """Fetch sparkline price history, returning None on failure so that errors are not cached."""
+    url = "https://api.coingecko.com/api/v3/coins/markets"
+    params = {
+        "vs_currency": currency,
+        "ids": ",".join(symbols),
+        "sparkline": "true",
+        "price_change_percentage": "7d",
+    }
+    try:
+        entries = conditional_get_json(url, params=params)
+        if not isinstance(entries, list):
+            raise TypeError(f"expected a list of markets, got {type(entries).__name__}")
+        histories = {}
+        for entry in entries:
+            prices = np.asarray((entry.get("sparkline_in_7d") or {}).get("price") or [], dtype=np.float64)
+            prices = prices[~np.isnan(prices)]  # CoinGecko pads sparkline gaps with nulls
+            if prices.size:
+                histories[entry["id"]] = prices
+        return histories
+    except (httpx.HTTPError, ValueError, TypeError, KeyError, AttributeError) as e:
+        logging.error("Failed to fetch historical prices for %s: %s", list(symbols), e)
+        return None
+
+
+async def fetch_inputs_async(symbols: List[str], currency: str):
+    """Fetch market data, news and price history for all symbols concurrently.
+
+    Returns a tuple (market_data, news, histories) where histories maps symbol to a price array.
+    """
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        loop.run_in_executor(None, fetch_market_data, symbols, currency),
+        loop.run_in_executor(None, fetch_news),
+        loop.run_in_executor(None, fetch_all_historical, symbols, currency),
+    )
+
+
+def fetch_news(limit: int = 5) -> List[str]:
+    """Fetch latest news headlines from CryptoNews API if API key provided."""
+    api_key = os.getenv("NEWS_API_KEY")
+    if not api_key:
+        return []
+    headlines = _fetch_news_cached(limit, api_key)
+    return headlines if headlines is not None else []
+
+
+@ttl_cache(60)
+def _fetch_news_cached(limit: int, api_key: str) -> Optional[List[str]]:
+    """Fetch news headlines, returning None on failure so that errors are not cached."""
+    url = "https://cryptonews-api.com/api/v1/category"
+    params = {"section": "general", "items": limit, "apikey": api_key}
+    try:
+        response = CLIENT.get(url, params=params)
+        response.raise_for_status()
+        data = json_loads(response.content)
+        return [article.get("title", "") for article in data.get("data", [])]
+    except (httpx.HTTPError, ValueError) as e:
+        logging.error("Failed to fetch news: %s", e)
+        return None
+
+
+# Last market data sent to the model and its serialized JSON, reused while prices are unchanged.
+_market_data_json: Tuple[Dict[str, Any], bytes] = ({}, b"{}")
+
+
+def _encode_model_payload(market_data: Dict[str, Any], news: List[str]) -> bytes:
+    """Serialize the model request body, reusing the cached market data JSON when it has not changed."""
+    global _market_data_json
+    if market_data != _market_data_json[0]:
+        _market_data_json = (dict(market_data), json_dumps(market_data))
+    return b'{"market_data":' + _market_data_json[1] + b',"news":' + json_dumps(news) + b"}"
+
+
+# Recent model answers: blake2b digest of (URL, request body) -> (fetched_at, action). The cache
+# lives in process memory only, so it helps long-running or replay callers that analyze repeatedly,
+# not separate cron invocations.
+_model_cache: Dict[bytes, Tuple[float, str]] = {}
+_MODEL_CACHE_TTL = 30.0
+_MODEL_CACHE_MAXSIZE = 128
+
+
+def analyze_with_model(market_data: Dict[str, Any], news: List[str]) -> str:
+    """
+    Send combined market data and news to external AI model and return action (buy/hold/sell).
+    `market_data` is sent as given: ai_trading_bot.py nests prices per currency, the enhanced bot sends flat prices.
+    """
+    model_url = os.getenv("MODEL_API_URL")
+    model_key = os.getenv("MODEL_API_KEY")
+    if not model_url or not model_key:
+        # Default behaviour when no model is configured.
+        return "hold"
+    body = _encode_model_payload(market_data, news)
+    # Identical payloads seen by this process within the TTL reuse the previous answer
+    key = hashlib.blake2b(model_url.encode() + b"\0" + body, digest_size=16).digest()
+    now = time.monotonic()
+    hit = _model_cache.get(key)
+    if hit is not None and now - hit[0] < _MODEL_CACHE_TTL:
+        return hit[1]
+    headers = {"Authorization": f"Bearer {model_key}", "Content-Type": "application/json"}
+    try:
+        response = CLIENT.post(model_url, content=body, headers=headers, timeout=httpx.Timeout(15.0, connect=3.0))
+        response.raise_for_status()
+        result = json_loads(response.content)
+        # Older model deployments answer with "signal" instead of "action".
+        action = result.get("action", result.get("signal", "hold"))
+        _model_cache.pop(key, None)
+        _model_cache[key] = (now, action)
+        if len(_model_cache) > _MODEL_CACHE_MAXSIZE:
+            del _model_cache[next(iter(_model_cache))]
+        return action
+    except (httpx.HTTPError, ValueError) as e:
+        logging.error("Failed to call model API: %s", e)
+        return "hold"
+
+
+def calculate_trade_levels(price: float, action: str, tp_pct: float, sl_pct: float) -> Tuple[float, float]:
+    """Calculate take-profit and stop-loss levels based on current price and action."""
+    tp_mul, sl_mul = trade_level_multipliers(action, tp_pct, sl_pct)
+    return price * tp_mul, price * sl_mul
@@ -0,0 +1,148 @@
+"""
+Shared HTTP client for the AI trading bot.
+
+All outgoing API calls (CoinGecko, news providers, model APIs and Telegram) go through a single
+pooled keep-alive httpx client so that repeated calls reuse open connections instead of paying a new
+TCP/TLS handshake each time. HTTP/2 is used when the optional "h2" package is installed, letting
+concurrent calls to the same host share one connection.
+"""
+
+import email.utils
+import functools
+import importlib.util
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    import json
+    from json import loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize `obj` to compact UTF-8 JSON bytes, matching orjson.dumps."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# httpx logs every request URL at INFO, and our URLs carry API keys and the Telegram bot token.
+for _logger_name in ("httpx", "httpcore"):
+    logging.getLogger(_logger_name).setLevel(logging.WARNING)
+
+# Default timeout applied to every request: 3s to connect, 10s for everything else.
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+# Idempotent requests answered with one of these statuses are retried, waiting as long as the
+# server's Retry-After header asks (up to a cap) or with exponential backoff when it is absent.
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_RETRY_METHODS = frozenset(("GET", "HEAD"))
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+_MAX_RETRY_AFTER = 30.0
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying `response`, honouring Retry-After (seconds or HTTP date)."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), _MAX_RETRY_AFTER)
+    return _BACKOFF_FACTOR * 2 ** attempt
+
+
+class _RetryTransport(httpx.HTTPTransport):
+    """HTTP transport that also retries idempotent requests on rate-limit and server error responses."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(_MAX_RETRIES):
+            response = super().handle_request(request)
+            if request.method not in _RETRY_METHODS or response.status_code not in _RETRY_STATUSES:
+                return response
+            response.close()
+            time.sleep(_retry_delay(response, attempt))
+        return super().handle_request(request)
+
+
+# httpx sets Accept-Encoding itself, adding "br" only when a brotli decoder is installed.
+CLIENT = httpx.Client(
+    transport=_RetryTransport(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        retries=_MAX_RETRIES,  # connection failures
+    ),
+    headers={"User-Agent": "ai-trading-bot/1.0"},
+    timeout=DEFAULT_TIMEOUT,
+)
+
+# Conditional GET cache: (url, params) -> (fetched_at, etag, last_modified, parsed JSON body).
+_etag_cache: Dict[Tuple[str, Tuple], Tuple[float, Optional[str], Optional[str], Any]] = {}
+
+
+def conditional_get_json(url: str, params: Optional[Dict[str, Any]] = None, ttl: float = 5.0) -> Any:
+    """
+    GET a JSON resource through the shared client, revalidating cached copies.
+
+    Responses younger than `ttl` seconds are returned without touching the network. Older ones are
+    revalidated with If-None-Match / If-Modified-Since, and a 304 Not Modified reply reuses the cached
+    body. Raises httpx.HTTPError on failures, like a plain CLIENT.get + raise_for_status.
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    now = time.monotonic()
+    cached = _etag_cache.get(key)
+    headers = {}
+    if cached is not None:
+        fetched_at, etag, last_modified, data = cached
+        if now - fetched_at < ttl:
+            return data
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = CLIENT.get(url, params=params, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        _etag_cache[key] = (now,) + cached[1:]
+        return cached[3]
+    response.raise_for_status()
+    data = json_loads(response.content)
+    _etag_cache[key] = (now, response.headers.get("ETag"), response.headers.get("Last-Modified"), data)
+    return data
+
+
+def ttl_cache(seconds: float, maxsize: int = 128) -> Callable:
+    """
+    Memoize a function's results for `seconds`, keyed by its (hashable) arguments.
+
+    At most `maxsize` entries are kept; the oldest entry is evicted first. None results are treated
+    as failures and are not cached, so the next call retries.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now - hit[0] < seconds:
+                return hit[1]
+            value = func(*args, **kwargs)
+            if value is not None:
+                cache.pop(key, None)
+                cache[key] = (now, value)
+                if len(cache) > maxsize:
+                    del cache[next(iter(cache))]
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -4,10 +4,18 @@ This module allows selecting different AI models (e.g., default, Hugging Face, O
 """
 
 import os
-import requests
 import logging
 from typing import Optional, Dict
 
+from http_utils import CLIENT, json_loads
+
+# Environment variables holding the (API URL, API key) for each supported model.
+_MODEL_ENV = {
+    "openai": ("OPENAI_API_URL", "OPENAI_API_KEY"),
+    "huggingface": ("HUGGINGFACE_API_URL", "HUGGINGFACE_API_KEY"),
+    "default": ("MODEL_API_URL", "MODEL_API_KEY"),
+}
+
 def analyze_text_with_model(
     text: str,
     model: str = "default",
@@ -24,37 +32,27 @@ def analyze_text_with_model(
     :return: A dictionary with keys 'label' and 'score'.
     """
     # Determine model-specific environment variables
+    url_env, key_env = _MODEL_ENV.get(model, _MODEL_ENV["default"])
     if model_api_url is None:
-        if model == "openai":
-            model_api_url = os.getenv("OPENAI_API_URL")
-        elif model == "huggingface":
-            model_api_url = os.getenv("HUGGINGFACE_API_URL")
-        else:
-            model_api_url = os.getenv("MODEL_API_URL")
+        model_api_url = os.getenv(url_env)
     if model_api_key is None:
-        if model == "openai":
-            model_api_key = os.getenv("OPENAI_API_KEY")
-        elif model == "huggingface":
-            model_api_key = os.getenv("HUGGINGFACE_API_KEY")
-        else:
-            model_api_key = os.getenv("MODEL_API_KEY")
+        model_api_key = os.getenv(key_env)
 
     if not model_api_url or not model_api_key:
         logging.warning("Model API URL or API key not configured. Returning default neutral signal.")
         return {"label": "hold", "score": 0.0}
 
     try:
-        response = requests.post(
+        response = CLIENT.post(
             model_api_url,
             headers={
                 "Authorization": f"Bearer {model_api_key}",
                 "Content-Type": "application/json",
             },
             json={"text": text, "model": model},
-            timeout=10,
         )
         response.raise_for_status()
-        result = response.json()
+        result = json_loads(response.content)
         return result.get("data", {"label": "hold", "score": 0.0})
     except Exception as e:
         logging.error(f"Failed to analyze text with model {model}: {e}")
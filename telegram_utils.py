@@ -7,9 +7,11 @@ and TELEGRAM_CHAT_ID environment variables to be set.
 
 import os
 import logging
-import requests
+import httpx
 from typing import Optional
 
+from http_utils import CLIENT
+
 
 def send_telegram_message(message: str, bot_token: Optional[str] = None, chat_id: Optional[str] = None) -> None:
     """
@@ -30,8 +32,8 @@ def send_telegram_message(message: str, bot_token: Optional[str] = None, chat_id
     payload = {"chat_id": chat, "text": message}
 
     try:
-        response = requests.post(url, json=payload, timeout=10)
+        response = CLIENT.post(url, json=payload)
         response.raise_for_status()
         logging.info("Message sent to Telegram successfully.")
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logging.error("Failed to send Telegram message: %s", e)
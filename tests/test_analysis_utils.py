@@ -0,0 +1,84 @@
+import unittest
+
+import numpy as np
+
+import analysis_utils
+from analysis_utils import (
+    calculate_moving_average,
+    calculate_rsi,
+    calculate_trade_levels_batch,
+    mean_of_histories,
+    rolling_sma,
+)
+
+
+class TestMovingAverage(unittest.TestCase):
+    def test_empty(self):
+        self.assertIsNone(calculate_moving_average([]))
+
+    def test_uses_last_window(self):
+        self.assertAlmostEqual(calculate_moving_average([100.0, 1.0, 2.0, 3.0], window=3), 2.0)
+
+    def test_short_input_averages_all(self):
+        self.assertAlmostEqual(calculate_moving_average([1.0, 2.0], window=7), 1.5)
+
+    def test_rolling_sma(self):
+        result = rolling_sma([1.0, 2.0, 3.0, 4.0], 2)
+        self.assertEqual(result.tolist(), [1.5, 2.5, 3.5])
+        self.assertEqual(len(rolling_sma([1.0], 2)), 0)
+
+    def test_mean_of_histories(self):
+        result = mean_of_histories([np.array([1.0, 3.0]), None, np.array([2.0, 4.0, 6.0])])
+        self.assertEqual(result[0], 2.0)
+        self.assertTrue(np.isnan(result[1]))
+        self.assertEqual(result[2], 4.0)
+        self.assertTrue(np.isnan(mean_of_histories([np.array([])])[0]))
+        self.assertEqual(mean_of_histories([]).shape, (0,))
+
+
+class TestCalculateRsi(unittest.TestCase):
+    def test_not_enough_data(self):
+        self.assertIsNone(calculate_rsi([1.0, 2.0, 3.0], period=14))
+
+    def test_only_gains(self):
+        prices = [float(p) for p in range(1, 17)]
+        self.assertAlmostEqual(calculate_rsi(prices, period=14), 100 - 100 / (1 + 1 / 0.001))
+
+    def test_mixed_changes(self):
+        prices = [10.0, 11.0, 10.0, 12.0, 11.0]
+        # gains = 1 + 2 = 3, losses = 1 + 1 = 2 over 4 periods -> RS = 1.5
+        self.assertAlmostEqual(calculate_rsi(prices, period=4), 60.0)
+
+    def test_numpy_path_matches_kernel(self):
+        # calculate_rsi only takes the NumPy path when numba is missing, so compare the two directly
+        fixtures = [
+            ([float(p) for p in range(1, 17)], 14),
+            ([10.0, 11.0, 10.0, 12.0, 11.0], 4),
+            ([100.0, 101.5, 99.0, 98.5, 102.0, 103.0, 101.0, 100.5], 5),
+        ]
+        for prices, period in fixtures:
+            arr = np.ascontiguousarray(prices, dtype=np.float64)
+            self.assertAlmostEqual(analysis_utils._rsi_numpy(arr, period), analysis_utils._rsi_core(arr, period))
+
+
+class TestCalculateTradeLevelsBatch(unittest.TestCase):
+    def test_buy(self):
+        tp, sl = calculate_trade_levels_batch([100.0, 200.0], "buy", 0.02, 0.01)
+        self.assertAlmostEqual(tp[0], 102.0)
+        self.assertAlmostEqual(tp[1], 204.0)
+        self.assertAlmostEqual(sl[0], 99.0)
+        self.assertAlmostEqual(sl[1], 198.0)
+
+    def test_sell(self):
+        tp, sl = calculate_trade_levels_batch([200.0], "sell", 0.03, 0.015)
+        self.assertAlmostEqual(tp[0], 194.0)
+        self.assertAlmostEqual(sl[0], 203.0)
+
+    def test_hold(self):
+        tp, sl = calculate_trade_levels_batch([50.0, 60.0], "hold", 0.05, 0.02)
+        self.assertEqual(tp.tolist(), [50.0, 60.0])
+        self.assertEqual(sl.tolist(), [50.0, 60.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import json
+import unittest
+from unittest import mock
+
+import httpx
+
+import core
+
+
+class TestEncodeModelPayload(unittest.TestCase):
+    def test_matches_plain_json_encoding(self):
+        market_data = {"bitcoin": 65000.5, "ethereum": 3200.0}
+        for news in (["Headline one"], [], ["Headline \"two\""]):
+            body = core._encode_model_payload(market_data, news)
+            self.assertEqual(json.loads(body), {"market_data": market_data, "news": news})
+
+    def test_keeps_nested_per_currency_prices(self):
+        market_data = {"bitcoin": {"usd": 65000.0}}
+        body = core._encode_model_payload(market_data, [])
+        self.assertEqual(json.loads(body)["market_data"], {"bitcoin": {"usd": 65000.0}})
+
+    def test_picks_up_changed_market_data(self):
+        core._encode_model_payload({"bitcoin": 1.0}, [])
+        body = core._encode_model_payload({"bitcoin": 2.0}, [])
+        self.assertEqual(json.loads(body)["market_data"], {"bitcoin": 2.0})
+
+
+class TestFetchAllHistorical(unittest.TestCase):
+    def setUp(self):
+        core._fetch_all_historical_cached.cache_clear()
+
+    def test_parses_sparklines_and_skips_gaps(self):
+        entries = [
+            {"id": "bitcoin", "sparkline_in_7d": {"price": [1.0, None, 3.0]}},
+            {"id": "ethereum", "sparkline_in_7d": {"price": []}},
+        ]
+        with mock.patch("core.conditional_get_json", return_value=entries) as get:
+            histories = core.fetch_all_historical(["bitcoin", "ethereum"], "usd")
+        self.assertEqual(get.call_args.kwargs["params"]["ids"], "bitcoin,ethereum")
+        self.assertEqual(histories["bitcoin"].tolist(), [1.0, 3.0])
+        self.assertNotIn("ethereum", histories)
+
+    def test_unexpected_response_yields_empty_mapping(self):
+        for body in ({"error": "rate limited"}, [{"sparkline_in_7d": {"price": [1.0]}}], ["bitcoin"], None):
+            with mock.patch("core.conditional_get_json", return_value=body):
+                self.assertEqual(core.fetch_all_historical(["bitcoin"], "usd"), {})
+
+    def test_repeat_call_within_ttl_is_served_from_cache(self):
+        entries = [{"id": "bitcoin", "sparkline_in_7d": {"price": [1.0, 2.0]}}]
+        with mock.patch("core.conditional_get_json", return_value=entries) as get:
+            first = core.fetch_all_historical(["bitcoin"], "usd")
+            second = core.fetch_all_historical(["bitcoin"], "usd")
+        self.assertEqual(get.call_count, 1)
+        self.assertIs(first, second)
+
+    def test_failures_are_not_cached(self):
+        with mock.patch("core.conditional_get_json", side_effect=httpx.ConnectError("down")) as get:
+            self.assertEqual(core.fetch_all_historical(["bitcoin"], "usd"), {})
+            self.assertEqual(core.fetch_all_historical(["bitcoin"], "usd"), {})
+        self.assertEqual(get.call_count, 2)
+
+
+class TestFetchNews(unittest.TestCase):
+    def setUp(self):
+        core._fetch_news_cached.cache_clear()
+
+    def test_failures_are_not_cached(self):
+        with mock.patch.dict("os.environ", {"NEWS_API_KEY": "key"}), \
+                mock.patch("core.CLIENT.get", side_effect=httpx.ConnectError("down")) as get:
+            self.assertEqual(core.fetch_news(), [])
+            self.assertEqual(core.fetch_news(), [])
+        self.assertEqual(get.call_count, 2)
+
+    def test_successful_fetch_is_cached(self):
+        with mock.patch.dict("os.environ", {"NEWS_API_KEY": "key"}), mock.patch("core.CLIENT.get") as get:
+            get.return_value.content = b'{"data": [{"title": "Headline"}]}'
+            self.assertEqual(core.fetch_news(), ["Headline"])
+            self.assertEqual(core.fetch_news(), ["Headline"])
+        self.assertEqual(get.call_count, 1)
+
+
+class TestAnalyzeWithModel(unittest.TestCase):
+    def setUp(self):
+        core._model_cache.clear()
+
+    def test_identical_payload_is_answered_from_cache(self):
+        env = {"MODEL_API_URL": "https://model.example/api", "MODEL_API_KEY": "key"}
+        with mock.patch.dict("os.environ", env), mock.patch("core.CLIENT.post") as post:
+            post.return_value.content = b'{"action": "buy"}'
+            first = core.analyze_with_model({"bitcoin": 1.0}, ["news"])
+            second = core.analyze_with_model({"bitcoin": 1.0}, ["news"])
+            core.analyze_with_model({"bitcoin": 2.0}, ["news"])
+        self.assertEqual((first, second), ("buy", "buy"))
+        self.assertEqual(post.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import json
+import logging
+import unittest
+from unittest import mock
+
+import httpx
+
+import http_utils
+
+
+def _response(status_code, body=None, etag=None):
+    content = json.dumps(body).encode() if body is not None else b""
+    return mock.Mock(status_code=status_code, headers={"ETag": etag} if etag else {}, content=content)
+
+
+class TestConditionalGetJson(unittest.TestCase):
+    def setUp(self):
+        http_utils._etag_cache.clear()
+
+    def test_not_modified_reuses_cached_body(self):
+        url = "https://example.com/price"
+        with mock.patch.object(http_utils.CLIENT, "get") as get:
+            get.return_value = _response(200, {"bitcoin": {"usd": 1.0}}, etag='"v1"')
+            first = http_utils.conditional_get_json(url, {"ids": "bitcoin"}, ttl=0)
+            get.return_value = _response(304)
+            second = http_utils.conditional_get_json(url, {"ids": "bitcoin"}, ttl=0)
+        self.assertEqual(first, second)
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+
+    def test_fresh_entry_skips_request(self):
+        url = "https://example.com/price"
+        with mock.patch.object(http_utils.CLIENT, "get") as get:
+            get.return_value = _response(200, {"bitcoin": {"usd": 1.0}})
+            http_utils.conditional_get_json(url, ttl=60)
+            http_utils.conditional_get_json(url, ttl=60)
+        self.assertEqual(get.call_count, 1)
+
+
+class TestTtlCache(unittest.TestCase):
+    def test_caches_until_expiry_and_skips_none(self):
+        calls = []
+
+        @http_utils.ttl_cache(60)
+        def fetch(symbol):
+            calls.append(symbol)
+            return None if symbol == "missing" else symbol.upper()
+
+        self.assertEqual(fetch("bitcoin"), "BITCOIN")
+        self.assertEqual(fetch("bitcoin"), "BITCOIN")
+        fetch("missing")
+        fetch("missing")
+        self.assertEqual(calls, ["bitcoin", "missing", "missing"])
+
+    def test_evicts_oldest_entry(self):
+        @http_utils.ttl_cache(60, maxsize=2)
+        def fetch(value):
+            return object()
+
+        first = fetch(1)
+        fetch(2)
+        fetch(3)
+        self.assertIsNot(fetch(1), first)
+
+
+class TestRetryTransport(unittest.TestCase):
+    def _send(self, method, responses):
+        with mock.patch.object(httpx.HTTPTransport, "handle_request", side_effect=responses) as handle, \
+                mock.patch("http_utils.time.sleep") as sleep:
+            response = http_utils.CLIENT.request(method, "https://example.com/api")
+        return response, handle.call_count, [c.args[0] for c in sleep.call_args_list]
+
+    def test_get_is_retried_with_exponential_backoff(self):
+        response, attempts, delays = self._send("GET", [httpx.Response(503), httpx.Response(502), httpx.Response(200)])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(attempts, 3)
+        self.assertEqual(delays, [0.3, 0.6])
+
+    def test_gives_up_after_max_retries(self):
+        response, attempts, _ = self._send("GET", [httpx.Response(503)] * 10)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(attempts, http_utils._MAX_RETRIES + 1)
+
+    def test_post_and_client_errors_are_not_retried(self):
+        _, attempts, delays = self._send("POST", [httpx.Response(503), httpx.Response(200)])
+        self.assertEqual((attempts, delays), (1, []))
+        _, attempts, delays = self._send("GET", [httpx.Response(404), httpx.Response(200)])
+        self.assertEqual((attempts, delays), (1, []))
+
+    def test_honours_retry_after_with_cap(self):
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(429, headers={"Retry-After": "60"}),
+            httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+            httpx.Response(200),
+        ]
+        response, attempts, delays = self._send("GET", responses)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(attempts, 4)
+        self.assertEqual(delays, [2.0, http_utils._MAX_RETRY_AFTER, 0.0])
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestClientLogging(unittest.TestCase):
+    def test_request_urls_are_not_logged_at_info(self):
+        url = "https://api.telegram.org/botSECRET123/sendMessage"
+        handler = _RecordingHandler()
+        httpx_logger = logging.getLogger("httpx")
+        httpx_logger.addHandler(handler)
+        try:
+            with mock.patch.object(httpx.HTTPTransport, "handle_request", return_value=httpx.Response(200)):
+                http_utils.CLIENT.post(url, json={"text": "hi"})
+        finally:
+            httpx_logger.removeHandler(handler)
+        leaked = [r for r in handler.records if r.levelno >= logging.INFO and "SECRET123" in r.getMessage()]
+        self.assertEqual(leaked, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
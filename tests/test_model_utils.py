@@ -19,6 +19,15 @@ class TestModelUtils(unittest.TestCase):
             self.assertEqual(result["label"], "hold")
             self.assertEqual(result["score"], 0.0)
 
+    def test_huggingface_mode_uses_its_environment(self):
+        env = {"HUGGINGFACE_API_URL": "https://hf.example/api", "HUGGINGFACE_API_KEY": "hf-key"}
+        with mock.patch.dict(os.environ, env, clear=True), mock.patch("model_utils.CLIENT.post") as post:
+            post.return_value.content = b'{"data": {"label": "buy", "score": 0.9}}'
+            result = analyze_text_with_model("Bullish news.", model="huggingface")
+        self.assertEqual(result["label"], "buy")
+        self.assertEqual(post.call_args.args[0], "https://hf.example/api")
+        self.assertEqual(post.call_args.kwargs["headers"]["Authorization"], "Bearer hf-key")
+
 
 if __name__ == "__main__":
     unittest.main()